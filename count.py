@@ -16,6 +16,11 @@ from pathlib import Path
 from typing import Tuple
 
 
+# Compiled once; callers test for the plain substring first so most lines skip them.
+UNSAFE_KEYWORD_RE = re.compile(r'\bunsafe\b')
+UNSAFE_ITEM_RE = re.compile(r'\bunsafe\s+(fn|trait|impl)\b')
+
+
 def is_documentation_line(line: str) -> bool:
     """Check if a line is a documentation comment."""
     stripped = line.strip()
@@ -102,10 +107,10 @@ def count_lines_in_file(file_path: Path) -> Tuple[int, int, int, int, int]:
                 
                 # Check for unsafe keyword (unsafe fn, unsafe trait, unsafe impl, unsafe {})
                 # Match "unsafe" as a whole word (not part of another word)
-                if re.search(r'\bunsafe\b', stripped):
+                if 'unsafe' in stripped and UNSAFE_KEYWORD_RE.search(stripped):
                     saw_unsafe_keyword = True
                     # Check if it's an unsafe function/trait/impl (followed by fn/trait/impl)
-                    if re.search(r'\bunsafe\s+(fn|trait|impl)\b', stripped):
+                    if UNSAFE_ITEM_RE.search(stripped):
                         in_unsafe_function = True
                         unsafe_function_brace_depth = 0
                         unsafe_code += 1
@@ -255,10 +260,10 @@ def count_test_file(file_path: Path) -> Tuple[int, int, int, int, int]:
                 close_braces = stripped.count('}')
                 
                 # Check for unsafe keyword
-                if re.search(r'\bunsafe\b', stripped):
+                if 'unsafe' in stripped and UNSAFE_KEYWORD_RE.search(stripped):
                     saw_unsafe_keyword = True
                     # Check if it's an unsafe function/trait/impl
-                    if re.search(r'\bunsafe\s+(fn|trait|impl)\b', stripped):
+                    if UNSAFE_ITEM_RE.search(stripped):
                         in_unsafe_function = True
                         unsafe_function_brace_depth = 0
                         unsafe_code += 1